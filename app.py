@@ -5,6 +5,8 @@ import json
 import time
 import re
 import logging
+import ctypes
+import multiprocessing
 from datetime import datetime
 
 # Configure logging
@@ -22,6 +24,7 @@ app = Flask(__name__)
 
 # In production, use environment variables for security
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
+GEMINI_MODEL_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-pro"
 
 # Comprehensive fallback responses for common legal questions in India
 FALLBACK_RESPONSES = {
@@ -342,17 +345,260 @@ FALLBACK_RESPONSES = {
 def index():
     return render_template('index.html')
 
+# Keyword patterns, compiled once at import so that preforked workers share
+# them with the master instead of rebuilding them per request. Keywords match
+# whole words (plus plural/past/gerund endings, so "arrest" matches
+# "arrested"), never inside other words: "rti" must not match "reporting".
+FALLBACK_KEYWORDS = tuple(
+    (topic, re.compile(
+        r"\b(?:" + "|".join(re.escape(keyword.lower()) for keyword in data["keywords"]) + r")(?:s|es|d|ed|ing)?\b"
+    ))
+    for topic, data in FALLBACK_RESPONSES.items()
+)
+
+DISCLAIMER = (
+    "\n<br><br>\n<i>Disclaimer: This information is provided for educational purposes only "
+    "and does not constitute legal advice. For specific legal issues, please consult a qualified lawyer.</i>"
+)
+
+# Statute references such as "Section 50", "Sections 41A-41D and 60A",
+# "Article 22(1)" or "Art. 14"
+STATUTE_REF_PATTERN = re.compile(
+    r"\b(section|sec|article|art)s?\.?\s*"
+    r"(\d+[a-z]?(?:\(\w+\))*(?:\s*(?:-|to|,|and)\s*\d+[a-z]?(?:\(\w+\))*)*)",
+    re.IGNORECASE
+)
+STATUTE_NUMBER_PATTERN = re.compile(
+    r"(\d+)([a-z]?)(?:\(\w+\))*(?:\s*(?:-|to)\s*(\d+)([a-z]?))?",
+    re.IGNORECASE
+)
+STATUTE_KINDS = {"sec": "section", "art": "article"}
+
+# Acts and codes cited with section numbers in the fallback responses, with
+# the names and abbreviations used for them in queries and response texts
+STATUTE_ACTS = {
+    "constitution": ["constitution"],
+    "crpc": ["crpc", "cr.p.c", "criminal procedure code", "code of criminal procedure"],
+    "ipc": ["ipc", "indian penal code", "penal code"],
+    "rti act": ["rti", "right to information"],
+    "consumer protection act": ["consumer protection act"],
+    "hindu succession act": ["hindu succession act"],
+    "hindu marriage act": ["hindu marriage act"],
+    "it act": ["it act", "information technology act"],
+    "transfer of property act": ["transfer of property act"],
+    "registration act": ["registration act"],
+    "rera": ["rera", "real estate act", "real estate (regulation and development) act"],
+}
+STATUTE_ACT_NAMES = {alias: act for act, aliases in STATUTE_ACTS.items() for alias in aliases}
+STATUTE_ACT_PATTERN = re.compile(
+    r"\b(?:" + "|".join(re.escape(alias) for alias in sorted(STATUTE_ACT_NAMES, key=len, reverse=True)) + r")\b"
+)
+# Any "<name> Act" / "<name> Code", to notice queries citing Acts not listed above
+NAMED_ACT_PATTERN = re.compile(r"\b(?!the\b|this\b|that\b|an?\b)[a-z]+ (?:act|code)\b")
+
+STOPWORDS = {
+    "a", "an", "and", "are", "can", "do", "does", "for", "from", "how", "i",
+    "in", "india", "indian", "is", "me", "my", "of", "on", "or", "the", "to",
+    "under", "what", "when", "which", "with", "about", "explain", "tell",
+    "section", "sections", "article", "articles", "act", "law", "laws"
+}
+
+def expand_statute_ref(match):
+    """Return the normalised references covered by one STATUTE_REF_PATTERN match"""
+    kind = match.group(1).lower()
+    kind = STATUTE_KINDS.get(kind, kind)
+    refs = set()
+    for start, start_letter, end, end_letter in STATUTE_NUMBER_PATTERN.findall(match.group(2)):
+        start_letter, end_letter = start_letter.lower(), end_letter.lower()
+        refs.add(f"{kind} {start}{start_letter}")
+        if not end:
+            continue
+        refs.add(f"{kind} {end}{end_letter}")
+        if start == end and start_letter and end_letter:
+            # Lettered range within one section, e.g. 41A-41D
+            for code in range(ord(start_letter), ord(end_letter) + 1):
+                refs.add(f"{kind} {start}{chr(code)}")
+        elif 0 < int(end) - int(start) <= 100:
+            for number in range(int(start), int(end) + 1):
+                refs.add(f"{kind} {number}")
+    return refs
+
+def extract_statute_refs(text):
+    """Return normalised statute references ("section 41a", "article 22") in text"""
+    refs = set()
+    for match in STATUTE_REF_PATTERN.finditer(text):
+        refs.update(expand_statute_ref(match))
+    return refs
+
+def find_statute_acts(text):
+    """Return (start, end, act) for every known Act or code named in lowercased text"""
+    return [(match.start(), match.end(), STATUTE_ACT_NAMES[match.group()])
+            for match in STATUTE_ACT_PATTERN.finditer(text)]
+
+def extract_statute_citations(section, default_act):
+    """Return the (act, reference) pairs cited in a section.
+
+    A section reference belongs to the nearest Act named after it on the same
+    line ("Section 50 of CrPC"), else the nearest one before it ("CrPC
+    Sections 41A-41D"), else default_act. Articles belong to the Constitution.
+    """
+    citations = set()
+    for line in section.lower().splitlines():
+        acts = find_statute_acts(line)
+        for match in STATUTE_REF_PATTERN.finditer(line):
+            if match.group(1).startswith("art"):
+                act = "constitution"
+            else:
+                after = [act for start, _, act in acts if start >= match.end()]
+                before = [act for start, _, act in acts if start < match.start()]
+                act = after[0] if after else before[-1] if before else default_act
+            citations.update((act, ref) for ref in expand_statute_ref(match))
+    return citations
+
+def _stem(word):
+    """Crude suffix stripping so that "arrested"/"arrest" and "filing"/"file" match"""
+    for suffix in ("ing", "ed", "es", "e", "s"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[:-len(suffix)]
+    return word
+
+def extract_terms(text):
+    """Return the set of stemmed, non-trivial words in text (HTML tags removed)"""
+    words = re.findall(r"[a-z]+", re.sub(r"<[^>]+>", " ", text.lower()))
+    return {_stem(word) for word in words if len(word) > 2 and word not in STOPWORDS}
+
+def split_sections(response):
+    """Split a fallback response into its preamble (heading and intro) and
+    addressable sections: one per numbered item and one per trailing note"""
+    preamble, sections = [], []
+    for line in response.strip().splitlines():
+        line = line.strip()
+        if re.match(r"\d+\.\s", line) or (sections and line.startswith("<i>")):
+            sections.append([line])
+        elif sections:
+            sections[-1].append(line)
+        else:
+            preamble.append(line)
+    return (
+        "\n".join(preamble).strip(),
+        tuple("\n".join(lines).strip() for lines in sections)
+    )
+
+def build_section_index(responses):
+    """Split every fallback response into sections and index them by term and
+    by statute reference. Sections are addressed as (topic, position) within
+    sections[topic]["sections"]; statute hits also carry the cited Act."""
+    sections, section_index, statute_index = {}, {}, {}
+    
+    for topic, data in responses.items():
+        preamble, topic_sections = split_sections(data["response"])
+        sections[topic] = {
+            "preamble": preamble,
+            "sections": topic_sections,
+            "keyword_terms": frozenset(extract_terms(" ".join(data["keywords"])))
+        }
+        preamble_acts = find_statute_acts(preamble.lower())
+        for position, section in enumerate(topic_sections):
+            for term in extract_terms(section):
+                section_index.setdefault(term, []).append((topic, position))
+            # Unqualified references take the Act of the item's heading line,
+            # else of the topic's heading and intro
+            default_acts = find_statute_acts(section.lower().splitlines()[0]) or preamble_acts
+            default_act = default_acts[0][2] if default_acts else None
+            for act, ref in extract_statute_citations(section, default_act):
+                statute_index.setdefault(ref, []).append((act, topic, position))
+    
+    return (
+        sections,
+        {term: tuple(hits) for term, hits in section_index.items()},
+        {ref: tuple(hits) for ref, hits in statute_index.items()}
+    )
+
+# Built once at import, before gunicorn forks its workers
+FALLBACK_SECTIONS, SECTION_INDEX, STATUTE_INDEX = build_section_index(FALLBACK_RESPONSES)
+
+def find_fallback_topic(query):
+    """Find the best matching fallback topic for a lowercased query"""
+    for topic, pattern in FALLBACK_KEYWORDS:
+        if pattern.search(query):
+            return topic
+    
+    return None
+
+def find_statute_sections(query, topic):
+    """Find the sections citing the statutes referenced in a lowercased query.
+
+    Returns (topic, positions). A reference qualified by its Act ("Section 50
+    CrPC", any Article) is looked up across all topics and may override the
+    keyword-matched topic, though hits inside that topic are preferred. A bare
+    "Section N" is only trusted inside the keyword-matched topic, and a query
+    citing an Act the fallbacks do not cover gets no statute hits at all.
+    """
+    refs = extract_statute_refs(query)
+    if not refs:
+        return topic, set()
+    
+    acts = find_statute_acts(query)
+    for match in NAMED_ACT_PATTERN.finditer(query):
+        if not any(start <= match.start() and match.end() <= end for start, end, _ in acts):
+            return topic, set()
+    named = {act for _, _, act in acts}
+    
+    hits = set()
+    for ref in refs:
+        for act, hit_topic, position in STATUTE_INDEX.get(ref, ()):
+            qualified = act == "constitution" if ref.startswith("article") else act in named
+            if qualified or (not named and hit_topic == topic):
+                hits.add((hit_topic, position))
+    if not hits:
+        return topic, set()
+    
+    hit_topics = [t for t in FALLBACK_SECTIONS if any(hit[0] == t for hit in hits)]
+    best = topic if topic in hit_topics else hit_topics[0]
+    return best, {position for hit_topic, position in hits if hit_topic == best}
+
+def find_term_sections(query, topic):
+    """Find the positions of the sections of topic relevant to a lowercased query.
+
+    The query's words are looked up within the topic, ignoring words that
+    selected the topic and words common to most of it.
+    """
+    sections = FALLBACK_SECTIONS[topic]
+    matches = set()
+    for term in extract_terms(query) - sections["keyword_terms"]:
+        hits = [position for hit_topic, position in SECTION_INDEX.get(term, ()) if hit_topic == topic]
+        if len(hits) <= len(sections["sections"]) // 2:
+            matches.update(hits)
+    
+    return matches
+
 def find_fallback_response(query):
-    """Find the best matching fallback response for a query"""
+    """Find the best matching fallback response for a query, trimmed to the
+    relevant sections where possible"""
     query = query.lower()
+    topic, matches = find_statute_sections(query, find_fallback_topic(query))
+    if not topic:
+        return None
     
-    for topic, data in FALLBACK_RESPONSES.items():
-        for keyword in data["keywords"]:
-            if keyword.lower() in query:
-                logger.info(f"Using fallback for topic: {topic}")
-                return data["response"]
+    sections = FALLBACK_SECTIONS[topic]
+    if not matches:
+        matches = find_term_sections(query, topic)
+    if not matches:
+        # Nothing more specific than the topic itself; send all of its sections
+        matches = range(len(sections["sections"]))
     
-    return None
+    response = "\n\n".join(
+        [sections["preamble"]] + [sections["sections"][position] for position in sorted(matches)]
+    ) + DISCLAIMER
+    
+    # Report the saving against the whole topic response sent previously
+    size = len(response.encode("utf-8"))
+    full_size = len(FALLBACK_RESPONSES[topic]["response"].encode("utf-8"))
+    logger.info(
+        f"Using fallback for topic: {topic}, {len(matches)} of {len(sections['sections'])} section(s) "
+        f"({size} of {full_size} bytes, {1 - size / full_size:.0%} smaller)"
+    )
+    return response
 
 @app.route('/query', methods=['POST'])
 def process_query():
@@ -371,15 +617,21 @@ def process_query():
     
     # Use Gemini API if no fallback available
     try:
+        if not acquire_generation_slot():
+            raise Exception("Gemini API circuit open, skipping call")
+        
+        # The circuit sees one outcome per query, not one per attempt
         for attempt in range(3):  # 3 retry attempts
             try:
                 response = get_legal_response(user_query)
+                record_generation_result()
                 return jsonify({"response": response})
             except Exception as e:
                 logger.warning(f"API attempt {attempt+1} failed: {str(e)}")
                 if attempt < 2:  # Only wait if we're going to retry
                     time.sleep(2)
                 else:
+                    record_generation_result(e)
                     raise
     except Exception as e:
         logger.error(f"Error processing query: {str(e)}")
@@ -403,9 +655,185 @@ def process_query():
         """
         return jsonify({"response": fallback})
 
+# Upstream (Gemini API) health. Generation outcomes (/query, /test_api) drive
+# the circuit and the error rate; the background checker only publishes the
+# result of its cheap reachability probe. Probes read this cached state.
+UPSTREAM_CHECK_INTERVAL = int(os.getenv("UPSTREAM_CHECK_INTERVAL", "30"))  # seconds
+UPSTREAM_CHECK_STALE_AFTER = 3 * UPSTREAM_CHECK_INTERVAL  # checker presumed dead after this
+UPSTREAM_ERROR_WINDOW = 300  # seconds of history used for the error rate
+ERROR_BUCKET_SECONDS = 10  # granularity at which old outcomes expire from the window
+ERROR_BUCKETS = UPSTREAM_ERROR_WINDOW // ERROR_BUCKET_SECONDS
+CIRCUIT_FAILURE_THRESHOLD = 5  # consecutive failed queries (not attempts) that open the circuit
+CIRCUIT_RESET_SECONDS = 30  # time before an open circuit lets a trial query through
+CIRCUIT_TRIAL_TIMEOUT = 60  # a trial slot not released by then (worker killed) is reclaimed
+
+class UpstreamState(ctypes.Structure):
+    _fields_ = [
+        ("check_ok", ctypes.c_bool),
+        ("checked_at", ctypes.c_double),  # 0 until the first check completes
+        ("check_latency_ms", ctypes.c_double),
+        ("check_error", ctypes.c_char * 64),
+        ("consecutive_failures", ctypes.c_int),
+        ("opened_at", ctypes.c_double),  # 0 while the circuit is closed
+        ("trial_started_at", ctypes.c_double),  # 0 unless a half-open trial is in flight
+        ("bucket_start", ctypes.c_double * ERROR_BUCKETS),
+        ("bucket_calls", ctypes.c_int * ERROR_BUCKETS),
+        ("bucket_failures", ctypes.c_int * ERROR_BUCKETS),
+    ]
+
+# Allocated in shared memory at import. gunicorn imports the app in the master
+# before forking (preload_app), so the checker process and all workers read
+# and write the same state and readiness does not depend on which worker a
+# probe reaches.
+upstream_state = multiprocessing.Value(UpstreamState)
+
+class GeminiAPIError(Exception):
+    """Error response from the Gemini API; status_code is None for unusable 200 responses"""
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+
+def is_upstream_failure(error):
+    """Whether a failed query counts against the circuit.
+
+    Network errors, 5xx, 429 (quota) and 403 (key) say the upstream is
+    unusable. Other 4xx and blocked or unparsable answers are caused by the
+    query itself and say nothing about the next one.
+    """
+    if isinstance(error, requests.RequestException):
+        return True
+    status = getattr(error, "status_code", None)
+    return status is not None and (status >= 500 or status in (403, 429))
+
+def acquire_generation_slot():
+    """Return whether a generation call may be made now.
+
+    While the circuit is half-open exactly one caller, across all workers, is
+    given the trial slot; everyone else sees the circuit as open until the
+    trial records its result.
+    """
+    now = time.time()
+    with upstream_state.get_lock():
+        state = upstream_state.get_obj()
+        if not state.opened_at:
+            return True
+        if now - state.opened_at < CIRCUIT_RESET_SECONDS:
+            return False
+        if state.trial_started_at and now - state.trial_started_at < CIRCUIT_TRIAL_TIMEOUT:
+            return False
+        state.trial_started_at = now
+        return True
+
+def record_generation_result(error=None):
+    """Record the outcome of one query's generation attempts and update the circuit.
+
+    Pass the final exception for a failed query, or nothing on success.
+    """
+    now = time.time()
+    bucket_start = now // ERROR_BUCKET_SECONDS * ERROR_BUCKET_SECONDS
+    index = int(now // ERROR_BUCKET_SECONDS) % ERROR_BUCKETS
+    failed = error is not None and is_upstream_failure(error)
+    with upstream_state.get_lock():
+        state = upstream_state.get_obj()
+        state.trial_started_at = 0
+        if state.bucket_start[index] != bucket_start:
+            state.bucket_start[index] = bucket_start
+            state.bucket_calls[index] = 0
+            state.bucket_failures[index] = 0
+        state.bucket_calls[index] += 1
+        if failed:
+            state.bucket_failures[index] += 1
+            state.consecutive_failures += 1
+            if state.consecutive_failures >= CIRCUIT_FAILURE_THRESHOLD:
+                state.opened_at = now
+        elif error is None:
+            state.consecutive_failures = 0
+            state.opened_at = 0
+
+def circuit_state():
+    """Return "closed", "open" or "half-open" (open, but the trial slot is free)"""
+    now = time.time()
+    with upstream_state.get_lock():
+        state = upstream_state.get_obj()
+        opened_at, trial_started_at = state.opened_at, state.trial_started_at
+    if not opened_at:
+        return "closed"
+    if now - opened_at < CIRCUIT_RESET_SECONDS:
+        return "open"
+    if trial_started_at and now - trial_started_at < CIRCUIT_TRIAL_TIMEOUT:
+        return "open"
+    return "half-open"
+
+def upstream_error_rate():
+    """Return (fraction of failed generation calls, number of calls) within the error window"""
+    cutoff = time.time() - UPSTREAM_ERROR_WINDOW
+    calls = failures = 0
+    with upstream_state.get_lock():
+        state = upstream_state.get_obj()
+        for index in range(ERROR_BUCKETS):
+            if state.bucket_start[index] > cutoff:
+                calls += state.bucket_calls[index]
+                failures += state.bucket_failures[index]
+    if not calls:
+        return None, 0
+    return failures / calls, calls
+
+def check_upstream():
+    """Validate upstream reachability with a model metadata request (no generation quota).
+
+    A successful probe says nothing about generation quota, so the result is
+    published on its own and never closes the circuit.
+    """
+    start = time.time()
+    error = None
+    try:
+        response = requests.get(GEMINI_MODEL_URL, headers={"x-goog-api-key": GEMINI_API_KEY}, timeout=5)
+        if not response.ok:
+            error = f"API error {response.status_code}"
+    except requests.RequestException as e:
+        # Only the exception class is published: /health/ready is unauthenticated
+        # and the message can echo request details
+        error = type(e).__name__
+    
+    if error:
+        logger.warning(f"Upstream check failed: {error}")
+    
+    with upstream_state.get_lock():
+        state = upstream_state.get_obj()
+        state.check_ok = error is None
+        state.checked_at = time.time()
+        state.check_latency_ms = round((time.time() - start) * 1000, 1)
+        state.check_error = (error or "").encode("ascii", "replace")[:63]
+
+def run_upstream_checker(parent_pid):
+    """Run check_upstream every UPSTREAM_CHECK_INTERVAL seconds until the parent exits"""
+    while os.getppid() == parent_pid:
+        try:
+            check_upstream()
+        except Exception as e:
+            logger.error(f"Upstream checker error: {type(e).__name__}")
+        time.sleep(UPSTREAM_CHECK_INTERVAL)
+
+def start_upstream_checker():
+    """Fork the upstream checker into its own process and return its pid.
+
+    A separate process rather than a thread, so that no thread (and no lock
+    held mid-request) is alive when gunicorn forks workers. Results reach the
+    workers through upstream_state. Under gunicorn this is called once from
+    the on_starting hook, before any worker exists.
+    """
+    parent_pid = os.getpid()
+    pid = os.fork()
+    if pid:
+        return pid
+    try:
+        run_upstream_checker(parent_pid)
+    finally:
+        os._exit(0)
+
 def get_legal_response(query):
     """Get response from Gemini API with an improved legal prompt"""
-    endpoint = "https://generativelanguage.googleapis.com/v1beta/models/gemini-pro:generateContent"
+    endpoint = f"{GEMINI_MODEL_URL}:generateContent"
     
     # Improved prompt for more accurate legal information
     legal_prompt = f"""
@@ -458,10 +886,11 @@ def get_legal_response(query):
         ]
     }
     
-    headers = {"Content-Type": "application/json"}
+    # The key goes in a header so it never appears in URLs echoed by exceptions
+    headers = {"Content-Type": "application/json", "x-goog-api-key": GEMINI_API_KEY}
     
     response = requests.post(
-        f"{endpoint}?key={GEMINI_API_KEY}",
+        endpoint,
         headers=headers,
         json=request_body,
         timeout=15
@@ -475,7 +904,7 @@ def get_legal_response(query):
                 error_details += f": {error_data['error']['message']}"
         except:
             pass
-        raise Exception(error_details)
+        raise GeminiAPIError(error_details, response.status_code)
     
     data = response.json()
     
@@ -484,32 +913,68 @@ def get_legal_response(query):
         
         # Add disclaimer if not present
         if "<i>Disclaimer:" not in answer:
-            answer += """
-            <br><br>
-            <i>Disclaimer: This information is provided for educational purposes only and does not constitute legal advice. For specific legal issues, please consult a qualified lawyer.</i>
-            """
+            answer += DISCLAIMER
         
         return answer
         
     except (KeyError, IndexError) as e:
         logger.error(f"Error parsing API response: {e}")
-        raise Exception("Failed to parse API response")
+        raise GeminiAPIError("Failed to parse API response")
 
 @app.route('/test_api', methods=['GET'])
 def test_api():
     """Simple endpoint to verify API connectivity"""
     try:
         response = get_legal_response("Explain the Right to Information Act briefly")
+        record_generation_result()
         return jsonify({
             "status": "API working", 
             "timestamp": datetime.now().isoformat()
         })
     except Exception as e:
+        record_generation_result(e)
         return jsonify({
             "status": "API error", 
             "error": str(e)
         })
 
+@app.route('/health/live', methods=['GET'])
+def liveness():
+    """Liveness probe: the worker is up and serving requests"""
+    return jsonify({"status": "alive"})
+
+@app.route('/health/ready', methods=['GET'])
+def readiness():
+    """Readiness probe, answered from cached upstream state without calling the API"""
+    state = circuit_state()
+    error_rate, calls = upstream_error_rate()
+    with upstream_state.get_lock():
+        check = upstream_state.get_obj()
+        checked_at = check.checked_at
+        check_ok = check.check_ok if checked_at else None
+        latency_ms = check.check_latency_ms if checked_at else None
+        error = check.check_error.decode("ascii") or None
+    
+    # Not ready while generation keeps failing, the API is unreachable or the
+    # checker has stopped reporting
+    stale = bool(checked_at) and time.time() - checked_at > UPSTREAM_CHECK_STALE_AFTER
+    ready = state != "open" and check_ok is not False and not stale
+    
+    return jsonify({
+        "status": "ready" if ready else "not ready",
+        "circuit": state,
+        "upstream": {
+            "ok": check_ok,
+            "checked_at": datetime.fromtimestamp(checked_at).isoformat() if checked_at else None,
+            "age_seconds": round(time.time() - checked_at, 1) if checked_at else None,
+            "stale": stale,
+            "latency_ms": latency_ms,
+            "error": error,
+            "error_rate": error_rate,
+            "recent_calls": calls
+        }
+    }), 200 if ready else 503
+
 @app.route('/topics', methods=['GET'])
 def available_topics():
     """View available fallback topics"""
@@ -517,200 +982,8 @@ def available_topics():
     return jsonify({"available_topics": topics})
 
 if __name__ == '__main__':
-    # Create templates directory if it doesn't exist
-    templates_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
-    if not os.path.exists(templates_dir):
-        os.makedirs(templates_dir)
-        
-        # Create index.html if missing
-        index_path = os.path.join(templates_dir, 'index.html')
-        if not os.path.exists(index_path):
-            with open(index_path, 'w') as f:
-                f.write("""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Indian Law Assistant</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0-alpha1/dist/css/bootstrap.min.css" rel="stylesheet">
-    <style>
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background-color: #f5f7fa;
-            padding-bottom: 40px;
-        }
-        .header {
-            background-color: #1e3a8a;
-            color: white;
-            padding: 20px 0;
-            margin-bottom: 30px;
-            border-bottom: 5px solid #e2e8f0;
-        }
-        .query-container {
-            background-color: white;
-            border-radius: 8px;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-            padding: 30px;
-            margin-bottom: 30px;
-        }
-        .response-container {
-            background-color: white;
-            border-radius: 8px;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-            padding: 30px;
-            margin-top: 20px;
-            min-height: 200px;
-        }
-        #response-box {
-            padding: 20px;
-            border-radius: 6px;
-            background-color: #f8fafc;
-            border-left: 4px solid #3b82f6;
-        }
-        .loader {
-            display: none;
-            text-align: center;
-            margin: 20px 0;
-        }
-        .example-btn {
-            margin: 5px;
-            background-color: #e2e8f0;
-            border: none;
-            transition: all 0.2s;
-        }
-        .example-btn:hover {
-            background-color: #cbd5e1;
-        }
-        .btn-primary {
-            background-color: #2563eb;
-            border: none;
-        }
-        .btn-primary:hover {
-            background-color: #1d4ed8;
-        }
-    </style>
-</head>
-<body>
-    <div class="header text-center">
-        <div class="container">
-            <h1>Indian Law Assistant</h1>
-            <p>Get clear, accurate information on Indian laws and your legal rights</p>
-        </div>
-    </div>
-
-    <div class="container">
-        <div class="row justify-content-center">
-            <div class="col-lg-8">
-                <div class="query-container">
-                    <h3 class="mb-4">Ask a Legal Question</h3>
-                    <div class="mb-3">
-                        <label for="query-input" class="form-label">What would you like to know about Indian law?</label>
-                        <textarea class="form-control" id="query-input" rows="3" placeholder="Example: What are my rights if arrested?"></textarea>
-                    </div>
-                    <div class="d-grid gap-2">
-                        <button class="btn btn-primary" id="submit-btn">Get Answer</button>
-                    </div>
-                    
-                    <div class="mt-4 p-3 bg-light rounded">
-                        <h5>Common Topics:</h5>
-                        <div class="d-flex flex-wrap">
-                            <button class="btn example-btn">Rights if arrested</button>
-                            <button class="btn example-btn">How to file RTI</button>
-                            <button class="btn example-btn">Fundamental rights</button>
-                            <button class="btn example-btn">Consumer protection</button>
-                            <button class="btn example-btn">Property laws</button>
-                            <button class="btn example-btn">Divorce procedure</button>
-                            <button class="btn example-btn">Reporting cyber crime</button>
-                            <button class="btn example-btn">Labour rights</button>
-                            <button class="btn example-btn">Criminal procedure</button>
-                            <button class="btn example-btn">Family laws</button>
-                        </div>
-                    </div>
-                </div>
-
-                <div class="loader">
-                    <div class="spinner-border text-primary" role="status">
-                        <span class="visually-hidden">Loading...</span>
-                    </div>
-                    <p class="mt-2">Finding legal information...</p>
-                </div>
-
-                <div class="response-container" id="response-section" style="display: none;">
-                    <h3 class="mb-4">Legal Information</h3>
-                    <div id="response-box"></div>
-                </div>
-
-                <div class="mt-4 text-center text-muted">
-                    <small><strong>Disclaimer:</strong> This tool provides general information about Indian law for educational purposes only and does not constitute legal advice.</small>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0-alpha1/dist/js/bootstrap.bundle.min.js"></script>
-    <script>
-        document.addEventListener('DOMContentLoaded', function() {
-            const queryInput = document.getElementById('query-input');
-            const submitBtn = document.getElementById('submit-btn');
-            const responseSection = document.getElementById('response-section');
-            const responseBox = document.getElementById('response-box');
-            const loader = document.querySelector('.loader');
-            const exampleBtns = document.querySelectorAll('.example-btn');
-
-            exampleBtns.forEach(btn => {
-                btn.addEventListener('click', function() {
-                    queryInput.value = this.textContent;
-                    submitBtn.click();
-                });
-            });
-
-            submitBtn.addEventListener('click', async function() {
-                const query = queryInput.value.trim();
-                
-                if (!query) {
-                    alert('Please enter a legal question.');
-                    return;
-                }
-                
-                loader.style.display = 'block';
-                responseSection.style.display = 'none';
-                
-                try {
-                    const response = await fetch('/query', {
-                        method: 'POST',
-                        headers: {
-                            'Content-Type': 'application/json'
-                        },
-                        body: JSON.stringify({ query: query })
-                    });
-                    
-                    if (!response.ok) {
-                        throw new Error('Server error: ' + response.status);
-                    }
-                    
-                    const data = await response.json();
-                    
-                    loader.style.display = 'none';
-                    responseSection.style.display = 'block';
-                    responseBox.innerHTML = data.response;
-                    
-                    responseSection.scrollIntoView({ behavior: 'smooth' });
-                    
-                } catch (error) {
-                    console.error('Error:', error);
-                    loader.style.display = 'none';
-                    responseSection.style.display = 'block';
-                    responseBox.innerHTML = `
-                        <div class="alert alert-danger">
-                            <strong>Error:</strong> There was a problem processing your query. 
-                            Please try again later.
-                        </div>
-                    `;
-                }
-            });
-        });
-    </script>
-</body>
-</html>""")
-    
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    # Development server only; see wsgi.py and gunicorn.conf.py for production.
+    # The reloader runs the app in a child process, so start the checker there.
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_upstream_checker()
+    app.run(debug=True, host='0.0.0.0', port=5000)
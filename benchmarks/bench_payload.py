@@ -0,0 +1,132 @@
+"""Compare /query payload sizes for whole-topic and section-level fallbacks.
+
+Runs the example questions offered on the home page (topic-level, so every
+section is still sent) and a set of specific questions, and reports the JSON
+body size that the whole topic response used to produce against the
+response now returned, both raw and gzip-compressed.
+
+Before measuring, checks that queries naming statutes outside the fallback
+topics still go to Gemini and that section hits never leave the
+keyword-matched topic; exits non-zero if any check fails.
+
+    python benchmarks/bench_payload.py
+"""
+import gzip
+import json
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402
+
+# The example buttons in templates/index.html
+EXAMPLE_QUERIES = [
+    "Rights if arrested",
+    "How to file RTI",
+    "Fundamental rights",
+    "Consumer protection",
+    "Property laws",
+    "Divorce procedure",
+    "Reporting cyber crime",
+    "Labour rights",
+    "Criminal procedure",
+    "Family laws",
+]
+
+SPECIFIC_QUERIES = [
+    "Section 154 FIR",
+    "Section 50 CrPC",
+    "Article 22 police custody",
+    "What is anticipatory bail?",
+    "Section 13B mutual consent divorce",
+    "Registration Act section 17 property",
+    "Maintenance under Section 125",
+    "Consumer complaint against misleading advertisements",
+    "Inheritance rights of daughters under Section 6",
+    "Gratuity for fixed-term employees under labour laws",
+]
+
+# (query, topic whose sections may be returned or None if it must go to
+# Gemini, text the answer must contain)
+REGRESSION_CHECKS = [
+    ("Section 8 of the Arbitration Act", None, None),
+    ("Section 3 of the Dowry Prohibition Act", None, None),
+    ("Section 2 of the Negotiable Instruments Act", None, None),
+    ("Section 66C identity theft", None, None),
+    ("Section 17 of the Hindu Marriage Act", "family laws", None),
+    ("Section 50 CrPC", "rights if arrested", "Section 50 of CrPC"),
+    ("Section 420 of the Indian Penal Code", "cyber crime", "Cheating (Section 420)"),
+    ("Section 6 of the RTI Act", "rti act", "(Section 6)"),
+    ("Section 6 of the Hindu Succession Act", "inheritance laws", "(Section 6)"),
+    ("Section 54 of the Transfer of Property Act", "property laws", "(Section 54)"),
+    ("Article 22 police custody", "rights if arrested", "Article 22(1)"),
+    ("Reporting cyber crime", "cyber crime", None),
+    ("Consumer complaint against misleading advertisements", "consumer protection", None),
+    ("How to file RTI", "rti act", None),
+    ("Article 21", "fundamental rights", None),
+]
+
+
+def check_regressions():
+    failures = []
+    for query, expected, text in REGRESSION_CHECKS:
+        response = app.find_fallback_response(query)
+        if expected is None:
+            if response is not None:
+                failures.append(f"{query!r}: expected Gemini, got a fallback")
+            continue
+        sections = app.FALLBACK_SECTIONS[expected]
+        if response is None or not response.startswith(sections["preamble"]):
+            failures.append(f"{query!r}: expected a {expected!r} fallback")
+            continue
+        body = response[len(sections["preamble"]):-len(app.DISCLAIMER)]
+        stray = [part for part in body.split("\n\n") if part and part not in sections["sections"]]
+        if stray:
+            failures.append(f"{query!r}: sections from outside {expected!r}: {stray}")
+        elif text and text not in response:
+            failures.append(f"{query!r}: answer does not mention {text!r}")
+    return failures
+
+
+def sizes(response):
+    body = json.dumps({"response": response}).encode("utf-8")
+    return len(body), len(gzip.compress(body))
+
+
+def measure(title, queries):
+    totals = [0, 0, 0, 0]
+    print(f"\n{title:52} {'before':>8} {'after':>8} {'gz before':>10} {'gz after':>10}")
+    for query in queries:
+        topic = app.find_fallback_topic(query.lower())
+        if topic is None:
+            print(f"{query:52} {'gemini':>8}")
+            continue
+        before = sizes(app.FALLBACK_RESPONSES[topic]["response"])
+        after = sizes(app.find_fallback_response(query))
+        row = before[0], after[0], before[1], after[1]
+        totals = [total + value for total, value in zip(totals, row)]
+        print(f"{query:52} {row[0]:8} {row[1]:8} {row[2]:10} {row[3]:10}")
+    print(f"{'total':52} {totals[0]:8} {totals[1]:8} {totals[2]:10} {totals[3]:10}")
+    print(f"change: {totals[1] / totals[0] - 1:+.0%} raw, {totals[3] / totals[2] - 1:+.0%} gzip")
+    return totals
+
+
+def main():
+    logging.disable(logging.INFO)
+    failures = check_regressions()
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if failures:
+        sys.exit(1)
+    print(f"{len(REGRESSION_CHECKS)} routing checks passed")
+
+    examples = measure("example questions", EXAMPLE_QUERIES)
+    specific = measure("specific questions", SPECIFIC_QUERIES)
+    overall = [a + b for a, b in zip(examples, specific)]
+    print(f"\noverall change: {overall[1] / overall[0] - 1:+.0%} raw, {overall[3] / overall[2] - 1:+.0%} gzip")
+
+
+if __name__ == "__main__":
+    main()
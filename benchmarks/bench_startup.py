@@ -0,0 +1,116 @@
+"""Measure startup time and per-worker memory of the gunicorn deployment.
+
+Boots gunicorn twice, with and without preload_app, waits until every
+worker answers, then reports boot time and each worker's RSS/PSS/USS as
+read from /proc (Linux only). PSS and USS show how much of a worker's RSS
+is shared copy-on-write with the master versus private to the worker.
+
+    python benchmarks/bench_startup.py [--workers N] [--runs N]
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def import_time(runs):
+    """Median wall time of a cold `import app` in a fresh interpreter"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "import app"], cwd=ROOT, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def children(pid):
+    """Child pids of a process, oldest first"""
+    with open(f"/proc/{pid}/task/{pid}/children") as f:
+        pids = [int(child) for child in f.read().split()]
+    return sorted(pids, key=start_time)
+
+
+def start_time(pid):
+    with open(f"/proc/{pid}/stat") as f:
+        return int(f.read().rsplit(")", 1)[1].split()[19])
+
+
+def worker_pids(pid, preload):
+    """gunicorn worker pids; with preload the upstream checker is forked first"""
+    pids = children(pid)
+    return pids[1:] if preload else pids
+
+
+def memory_kb(pid):
+    """RSS, PSS and USS (private clean + dirty) of a process in KB"""
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    uss = fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0)
+    return fields.get("Rss", 0), fields.get("Pss", 0), uss
+
+
+def boot(workers, preload):
+    """Start gunicorn, wait until all workers are up, return (seconds, memory)"""
+    port = free_port()
+    env = dict(os.environ, PORT=str(port), WEB_CONCURRENCY=str(workers),
+               GUNICORN_PRELOAD="1" if preload else "0")
+    start = time.perf_counter()
+    server = subprocess.Popen([sys.executable, "-m", "gunicorn", "wsgi:application"],
+                              cwd=ROOT, env=env,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = start + 60
+        while True:
+            if time.perf_counter() > deadline or server.poll() is not None:
+                raise RuntimeError("gunicorn did not start")
+            try:
+                if len(worker_pids(server.pid, preload)) == workers:
+                    urllib.request.urlopen(f"http://127.0.0.1:{port}/topics", timeout=1).read()
+                    break
+            except OSError:
+                pass
+            time.sleep(0.01)
+        elapsed = time.perf_counter() - start
+        # Serve a few requests so every worker has finished its lazy setup
+        for _ in range(workers * 4):
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/topics", timeout=5).read()
+        return elapsed, [memory_kb(pid) for pid in worker_pids(server.pid, preload)]
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"import app (median of {args.runs}): {import_time(args.runs) * 1000:.1f} ms")
+    for preload in (False, True):
+        elapsed, memory = boot(args.workers, preload)
+        rss, pss, uss = (statistics.mean(column) for column in zip(*memory))
+        print(f"preload_app={preload}: boot {elapsed * 1000:.0f} ms, "
+              f"{args.workers} workers, per worker RSS {rss / 1024:.1f} MB, "
+              f"PSS {pss / 1024:.1f} MB, USS {uss / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Gunicorn settings for the Indian Law Assistant."""
+import gc
+import multiprocessing
+import os
+import signal
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+
+# Import app.py (fallback responses, keyword table, Flask app) once in the
+# master so that workers inherit it copy-on-write instead of rebuilding it
+preload_app = os.getenv("GUNICORN_PRELOAD", "1") != "0"
+
+checker_pid = None
+
+
+def on_starting(server):
+    # One upstream checker for the whole server, in its own process. It is
+    # forked here, before the arbiter sets up signals and sockets, and shares
+    # its results with the workers through memory allocated when the app was
+    # preloaded.
+    global checker_pid
+    if not server.cfg.preload_app:
+        server.log.warning(
+            "preload_app is off (GUNICORN_PRELOAD=0): no upstream checker runs and "
+            "/health/ready only reflects each worker's own queries"
+        )
+        return
+    from app import start_upstream_checker
+    checker_pid = start_upstream_checker()
+
+
+def when_ready(server):
+    # Move everything allocated so far out of the collector's reach; otherwise
+    # the first collection in each worker touches every object and un-shares
+    # the pages inherited from the master
+    gc.freeze()
+
+
+def on_exit(server):
+    if checker_pid:
+        try:
+            os.kill(checker_pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
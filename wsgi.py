@@ -0,0 +1,7 @@
+"""Production entry point for the Indian Law Assistant.
+
+Run with gunicorn (settings are read from gunicorn.conf.py):
+
+    gunicorn wsgi:application
+"""
+from app import app as application